@@ -2,26 +2,65 @@ from __future__ import annotations
 
 import argparse
 import csv
+import heapq
 import json
+import os
 import re
 import sys
-from dataclasses import dataclass
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter, itemgetter
 from pathlib import Path
-from typing import Final
+from typing import BinaryIO, Callable, Final, Iterable, Iterator, Sequence
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up, stdlib json is the fallback
+    orjson = None
 
 REPO_ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(REPO_ROOT))
 
-_MISSING_TOKENS = {"", "--", "-", "\u2014", "tba", "n/a", "na", "null"}
+_MISSING_TOKENS: Final[frozenset[str]] = frozenset(
+    {"", "--", "-", "\u2014", "tba", "n/a", "na", "null"}
+)
 _AUTO_PREVIOUS_FILL_PATCH: Final[str] = "previous_missing_filled"
 _MANUAL_OVERRIDE_PATCH: Final[str] = "manual_override"
 _DEFAULT_MANUAL_PATCH_FILENAME: Final[str] = "event_history_manual_patch.csv"
 _BY_EVENT_NDJSON_FILENAME: Final[str] = "event_history_by_event.ndjson"
 _BY_EVENT_INDEX_FILENAME: Final[str] = "event_history_by_event.index.json"
+_BY_EVENT_FLUSH_BYTES: Final[int] = 1 << 20
+_CSV_WRITE_BUFFER_BYTES: Final[int] = 1 << 20
 _CLEAN_CSV_FILENAME: Final[str] = "event_history_clean.csv"
 _MANUAL_APPLIED_CSV_FILENAME: Final[str] = "event_history_manual_patch_applied.csv"
 _MANUAL_APPLIED_JSON_FILENAME: Final[str] = "event_history_manual_patch_applied.json"
+# Issue types that describe problems the builder already resolved on its own.
+_SOLVED_ISSUE_TYPES: Final[frozenset[str]] = frozenset(
+    {
+        _AUTO_PREVIOUS_FILL_PATCH,
+        "stale_missing_actual_dropped",
+    }
+)
+# Issue keys with their own CSV column; anything else goes into "Details".
+_ISSUE_KNOWN_KEYS: Final[frozenset[str]] = frozenset(
+    {
+        "issue",
+        "event_id",
+        "cur",
+        "event",
+        "period",
+        "date",
+        "time",
+        "previous_raw",
+        "prior_actual",
+        "previous_effective",
+    }
+)
 # If an event has historical actual values but a specific release remains missing
 # its actual for too long, drop it from the clean index to avoid confusing charts.
 _STALE_MISSING_ACTUAL_DAYS: Final[int] = 2
@@ -54,9 +93,44 @@ _MONTH_ALIASES: Final[dict[str, str]] = {
     "november": "nov",
     "december": "dec",
 }
-_PERIOD_TOKEN_RE: Final[re.Pattern[str]] = re.compile(
-    r"^(?:q[1-4]|h[1-2])$", re.IGNORECASE
-)
+# Canonical month token for every accepted spelling, so normalization is one lookup.
+_MONTH_CANONICAL: Final[dict[str, str]] = {
+    **{month: month for month in _MONTH_ORDER},
+    **_MONTH_ALIASES,
+}
+
+
+def _json_dumps(
+    payload: object, *, indent: bool = False, newline: bool = False
+) -> bytes:
+    """Serialize `payload` to UTF-8 JSON bytes.
+
+    Indented output uses orjson when installed, which emits the same bytes as the
+    stdlib fallback. Single-line output (NDJSON records) always goes through the
+    stdlib with its default `", "` / `": "` separators, which orjson cannot produce,
+    so rebuilt and partially updated NDJSON files share one byte format and their
+    offsets stay stable. `newline` terminates the record.
+    """
+
+    if indent:
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+            if newline:
+                option |= orjson.OPT_APPEND_NEWLINE
+            return orjson.dumps(payload, option=option)
+        text = json.dumps(payload, ensure_ascii=False, indent=2)
+    else:
+        text = json.dumps(payload, ensure_ascii=False)
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def _json_loads(data: bytes | str) -> object:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
 @dataclass(frozen=True)
@@ -72,17 +146,48 @@ _FREQ_TOKENS: Final[list[tuple[re.Pattern[str], str]]] = [
     (re.compile(r"\b(?:qoq|q/q)\b", re.IGNORECASE), "q/q"),
     (re.compile(r"\b(?:wow|w/w)\b", re.IGNORECASE), "w/w"),
 ]
+# Compiled once: these run for every calendar row (event ids) and every revision
+# comparison (`_parse_numeric`), where the `re` module cache lookup adds up.
+_PARENTHETICAL_RE: Final[re.Pattern[str]] = re.compile(r"\(([^)]+)\)")
+_TAIL_PARENTHETICAL_RE: Final[re.Pattern[str]] = re.compile(r"\(([^)]+)\)\s*$")
+_TRAILING_PARENTHETICAL_RE: Final[re.Pattern[str]] = re.compile(r"\s*\(([^)]+)\)\s*$")
+_WHITESPACE_RUN_RE: Final[re.Pattern[str]] = re.compile(r"\s+")
+_NUMERIC_RE: Final[re.Pattern[str]] = re.compile(
+    r"([+-]?\d+(?:\.\d+)?)([kmb])?", re.IGNORECASE
+)
+_NUMERIC_SUFFIX_MULTIPLIERS: Final[dict[str | None, float]] = {
+    None: 1.0,
+    "k": 1_000.0,
+    "m": 1_000_000.0,
+    "b": 1_000_000_000.0,
+}
+# Year of an issue/patch "date": "YYYY-..." or "DD-MM-YYYY..." (only the dashes
+# and the year digits are checked in the second shape).
+_DATE_YEAR_RE: Final[re.Pattern[str]] = re.compile(r"(\d{4})-|..-..-(\d{4})", re.DOTALL)
+# Single-pass cleanup for `_parse_numeric`: normalize the unicode minus and drop
+# thousands separators, percent signs and spaces.
+_NUMERIC_CLEAN_TABLE: Final[dict[int, str | None]] = str.maketrans(
+    {"\u2212": "-", ",": None, "%": None, " ": None}
+)
+
+
+def _is_quarter_or_half_token(lowered: str) -> bool:
+    # Structural check for "q1".."q4" / "h1".."h2" on an already lowercased token.
+    if len(lowered) != 2:
+        return False
+    prefix, digit = lowered
+    return (prefix == "q" and digit in "1234") or (prefix == "h" and digit in "12")
 
 
 def _extract_parenthetical_tokens(text: str) -> list[str]:
-    return [m.group(1).strip() for m in re.finditer(r"\(([^)]+)\)", text)]
+    return [m.group(1).strip() for m in _PARENTHETICAL_RE.finditer(text)]
 
 
 def _looks_like_period_token(token: str) -> bool:
     normalized = _normalize_period(token)
     if normalized in _MONTH_ORDER or normalized in _MONTH_ALIASES:
         return True
-    return bool(_PERIOD_TOKEN_RE.match(normalized))
+    return _is_quarter_or_half_token(normalized)
 
 
 def _detect_frequency(text: str) -> str:
@@ -100,7 +205,7 @@ def _strip_known_suffixes(metric: str) -> str:
     trimmed = metric
     # Remove only from the end to avoid nuking important middle qualifiers.
     while True:
-        match = re.search(r"\s*\(([^)]+)\)\s*$", trimmed)
+        match = _TRAILING_PARENTHETICAL_RE.search(trimmed)
         if not match:
             break
         token = match.group(1).strip()
@@ -112,6 +217,10 @@ def _strip_known_suffixes(metric: str) -> str:
     return trimmed
 
 
+# Each (currency, event name) pair recurs every release across the years; the result
+# is immutable (str plus a frozen EventIdentity), so repeats are served from cache.
+# Sized above the ~20k distinct pairs of the full calendar history.
+@lru_cache(maxsize=1 << 15)
 def build_event_canonical_id(cur: str, event_name: str) -> tuple[str, EventIdentity]:
     currency = (cur or "").strip().upper()
     if currency in {"", "--", "-", "\u2014"}:
@@ -122,32 +231,33 @@ def build_event_canonical_id(cur: str, event_name: str) -> tuple[str, EventIdent
 
     period = ""
     # Prefer a trailing "(Jan)" / "(Q1)" etc if present.
-    tail = re.search(r"\(([^)]+)\)\s*$", raw)
+    tail = _TAIL_PARENTHETICAL_RE.search(raw)
     if tail and _looks_like_period_token(tail.group(1)):
         period = tail.group(1).strip()
 
     metric = _strip_known_suffixes(raw)
-    metric = re.sub(r"\s+", " ", metric).strip()
+    metric = _WHITESPACE_RUN_RE.sub(" ", metric).strip()
     safe_metric = metric.replace("::", " ")
 
     event_id = f"{currency}::{safe_metric}::{freq}"
     return event_id, EventIdentity(metric=metric, frequency=freq, period=period)
 
 
+# The period helpers and `_parse_numeric` are pure and see a small set of distinct
+# cell values (period tokens, recurring figures like "0.5%") across every row.
+@lru_cache(maxsize=1024)
 def _normalize_period(value: str) -> str:
     token = value.strip()
     if not token:
         return ""
-    lowered = token.lower().replace(".", "").strip()
-    if lowered in _MONTH_ORDER:
-        return lowered
-    if lowered in _MONTH_ALIASES:
-        return _MONTH_ALIASES[lowered]
-    if _PERIOD_TOKEN_RE.match(lowered):
-        return lowered.lower()
-    return lowered
+    lowered = token.lower()
+    if "." in lowered:
+        lowered = lowered.replace(".", "").strip()
+    # Quarter/half tokens ("q1", "h2") are already in canonical lowercase form.
+    return _MONTH_CANONICAL.get(lowered, lowered)
 
 
+@lru_cache(maxsize=1024)
 def _period_sort_value(
     period: str, reference_month: int | None = None
 ) -> tuple[int, int, str]:
@@ -167,7 +277,7 @@ def _period_sort_value(
     return (3, 0, normalized)
 
 
-@dataclass
+@dataclass(slots=True)
 class HistoryRow:
     year: int
     event_id: str
@@ -187,40 +297,40 @@ class HistoryRow:
     actual_effective: str = ""
     actual_revised_from: str = ""
     previous_revised_from: str = ""
+    # `actual` and `previous_raw` are fixed once the row is built, so their missing
+    # state is computed up front for the grouping/revision passes.
+    actual_missing: bool = False
+    previous_missing: bool = False
+    # Every pass orders rows by this key; it is built once per row and shared by all
+    # sorts.
+    history_key: tuple[datetime, tuple[int, int, str], str] = field(
+        init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.history_key = _history_sort_key(self)
 
 
 def _is_missing(value: str | None) -> bool:
-    if value is None:
+    if not value or value in _MISSING_TOKENS:
+        # Covers None and the usual exact spellings without allocating.
         return True
     return value.strip().lower() in _MISSING_TOKENS
 
 
+@lru_cache(maxsize=8192)
 def _parse_numeric(value: str) -> float | None:
     # Accept the first numeric token and ignore revision markers like "(rev.)" or "*".
-    text = (
-        value.strip()
-        .replace("−", "-")  # normalize unicode minus
-        .lower()
-        .replace(",", "")
-        .replace("%", "")
-        .replace(" ", "")
-    )
+    text = value.strip().translate(_NUMERIC_CLEAN_TABLE).lower()
     if not text:
         return None
 
-    match = re.search(r"([+-]?\d+(?:\.\d+)?)([kmb])?", text, re.IGNORECASE)
+    match = _NUMERIC_RE.search(text)
     if not match:
         return None
 
-    multiplier = 1.0
-    suffix = (match.group(2) or "").lower()
-    if suffix == "k":
-        multiplier = 1_000.0
-    elif suffix == "m":
-        multiplier = 1_000_000.0
-    elif suffix == "b":
-        multiplier = 1_000_000_000.0
-
+    # `text` is already lower-cased, so the suffix group is "k", "m", "b" or None.
+    multiplier = _NUMERIC_SUFFIX_MULTIPLIERS[match.group(2)]
     try:
         return float(match.group(1)) * multiplier
     except ValueError:
@@ -228,9 +338,15 @@ def _parse_numeric(value: str) -> float | None:
 
 
 def _values_match(left: str, right: str) -> bool:
-    if _is_missing(left) and _is_missing(right):
+    # Unrevised releases repeat the prior actual verbatim, and equal strings match
+    # under every rule below, so settle that before any parsing.
+    if left == right:
+        return True
+    left_missing = _is_missing(left)
+    right_missing = _is_missing(right)
+    if left_missing and right_missing:
         return True
-    if _is_missing(left) or _is_missing(right):
+    if left_missing or right_missing:
         return False
     left_num = _parse_numeric(left)
     right_num = _parse_numeric(right)
@@ -248,18 +364,89 @@ def _history_sort_key(item: HistoryRow) -> tuple[datetime, tuple[int, int, str],
     )
 
 
+_cached_history_sort_key = attrgetter("history_key")
+
+# Row tuples for the per-year CSVs, in header order; one C-level call per entry.
+_INDEX_CSV_VALUES = attrgetter(
+    "event_id", "date", "time", "period", "actual", "forecast", "previous_effective"
+)
+_CLEAN_CSV_VALUES = attrgetter(
+    "event_id",
+    "cur",
+    "event",
+    "period",
+    "date",
+    "time",
+    "actual",
+    "actual_effective",
+    "actual_revised_from",
+    "forecast",
+    "previous_raw",
+    "previous_effective",
+    "previous_revised_from",
+)
+# Previous-fill patch records always carry every key (see `build_index`), so the
+# patch CSV rows come from a plain itemgetter in header order.
+_PATCH_CSV_VALUES = itemgetter(
+    "patch",
+    "event_id",
+    "cur",
+    "event",
+    "period",
+    "date",
+    "time",
+    "previous_raw",
+    "prior_actual",
+    "previous_effective",
+)
+
+
 def _parse_history_datetime(date_value: str, time_value: str) -> datetime:
     date_text = date_value.strip()
     time_text = time_value.strip()
-    for fmt in ("%d-%m-%Y", "%Y-%m-%d"):
+    date_part = None
+    # Fast path for the zero-padded layouts every calendar file uses: slice and int()
+    # the fields directly. Anything else (unpadded, malformed, out-of-range) falls
+    # through to strptime, so accepted inputs and results are unchanged.
+    if (
+        len(date_text) == 10
+        and date_text.isascii()
+        and date_text.replace("-", "").isdigit()
+    ):
         try:
-            date_part = datetime.strptime(date_text, fmt)
-            break
+            if date_text[2] == "-" and date_text[5] == "-":
+                date_part = datetime(
+                    int(date_text[6:]), int(date_text[3:5]), int(date_text[:2])
+                )
+            elif date_text[4] == "-" and date_text[7] == "-":
+                date_part = datetime(
+                    int(date_text[:4]), int(date_text[5:7]), int(date_text[8:])
+                )
         except ValueError:
             date_part = None
+    if date_part is None:
+        for fmt in ("%d-%m-%Y", "%Y-%m-%d"):
+            try:
+                date_part = datetime.strptime(date_text, fmt)
+                break
+            except ValueError:
+                date_part = None
     if not date_part:
         return datetime.min
     if time_text and ":" in time_text:
+        if (
+            len(time_text) == 5
+            and time_text.isascii()
+            and time_text[2] == ":"
+            and time_text[:2].isdigit()
+            and time_text[3:].isdigit()
+        ):
+            try:
+                return date_part.replace(
+                    hour=int(time_text[:2]), minute=int(time_text[3:])
+                )
+            except ValueError:
+                return date_part
         try:
             time_part = datetime.strptime(time_text, "%H:%M")
             return datetime(
@@ -274,6 +461,9 @@ def _parse_history_datetime(date_value: str, time_value: str) -> datetime:
     return datetime(date_part.year, date_part.month, date_part.day)
 
 
+# Pure and called with the same few thousand date strings from the grouping passes,
+# the merge guards and the range checks; unbounded because distinct dates are few.
+@lru_cache(maxsize=None)
 def _parse_date_only(value: str) -> datetime.date | None:
     text = value.strip()
     if not text:
@@ -295,34 +485,107 @@ def _date_in_range(
     return start_date <= parsed <= end_date
 
 
+def _date_range_checker(
+    start_date: datetime.date,
+    end_date: datetime.date,
+    memo: dict[str, bool] | None = None,
+) -> Callable[[str], bool]:
+    """Return `_date_in_range` for a fixed range, memoized per date string."""
+
+    if memo is None:
+        memo = {}
+
+    def in_range(value: str) -> bool:
+        try:
+            return memo[value]
+        except KeyError:
+            result = memo[value] = _date_in_range(value, start_date, end_date)
+            return result
+
+    return in_range
+
+
+# Unbounded like `_parse_date_only`: a run sees over a thousand distinct issue/patch
+# dates, and records arrive grouped by event, so each date recurs throughout the run.
+@lru_cache(maxsize=None)
 def _year_from_date_text(value: str) -> int | None:
-    text = value.strip()
-    if not text:
+    match = _DATE_YEAR_RE.match(value.strip())
+    if match is None:
         return None
-    if len(text) >= 5 and text[:4].isdigit() and text[4] == "-":
-        return int(text[:4])
-    if len(text) >= 10 and text[2] == "-" and text[5] == "-" and text[6:10].isdigit():
-        return int(text[6:10])
-    return None
+    return int(match.group(1) or match.group(2))
+
+
+def _group_by_date_year(
+    records: list[dict],
+) -> tuple[dict[int, list[dict]], list[dict]]:
+    # Bucket issue/patch records by the year of their "date"; the rest go to misc.
+    by_year: defaultdict[int, list[dict]] = defaultdict(list)
+    misc: list[dict] = []
+    year_from_date_text = _year_from_date_text
+    for record in records:
+        date_value = record.get("date", "")
+        if not isinstance(date_value, str):
+            date_value = str(date_value)
+        year = year_from_date_text(date_value)
+        if year is None:
+            misc.append(record)
+        else:
+            by_year[year].append(record)
+    return by_year, misc
+
+
+def _group_issues_by_date_year(
+    issues: list[dict],
+) -> tuple[
+    dict[int, tuple[list[dict], list[dict], list[dict]]],
+    tuple[list[dict], list[dict], list[dict]],
+]:
+    # Like `_group_by_date_year`, but each bucket is an (all, open, solved) triple
+    # filled in the same pass, so the open/solved files need no re-walk.
+    by_year: defaultdict[int, tuple[list[dict], list[dict], list[dict]]] = defaultdict(
+        lambda: ([], [], [])
+    )
+    misc: tuple[list[dict], list[dict], list[dict]] = ([], [], [])
+    year_from_date_text = _year_from_date_text
+    solved_issue_types = _SOLVED_ISSUE_TYPES
+    for issue in issues:
+        date_value = issue.get("date", "")
+        if not isinstance(date_value, str):
+            date_value = str(date_value)
+        year = year_from_date_text(date_value)
+        all_issues, open_issues, solved_issues = misc if year is None else by_year[year]
+        all_issues.append(issue)
+        if str(issue.get("issue", "")) in solved_issue_types:
+            solved_issues.append(issue)
+        else:
+            open_issues.append(issue)
+    return by_year, misc
 
 
 def _load_year_rows(year_dir: Path, year: int) -> list[dict]:
     json_path = year_dir / f"{year}_calendar.json"
     if json_path.exists():
-        with json_path.open("r", encoding="utf-8") as handle:
-            payload = json.load(handle)
+        payload = _json_loads(json_path.read_bytes())
         return payload if isinstance(payload, list) else []
 
     csv_path = year_dir / f"{year}_calendar.csv"
     if csv_path.exists():
         with csv_path.open("r", encoding="utf-8") as handle:
-            reader = csv.DictReader(handle)
-            return list(reader)
+            # Each row maps header names to its cells; short rows lack the trailing
+            # keys, which the row builder reads through `.get` as missing.
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None:
+                return []
+            return [dict(zip(header, values)) for values in reader]
 
     return []
 
 
 def _safe_text(value: object) -> str:
+    # CSV cells (and most JSON values) are already plain strings: skip the str() call.
+    if type(value) is str:
+        return value.strip()
     if value is None:
         return ""
     text = str(value)
@@ -366,14 +629,14 @@ def _load_manual_overrides(
                     continue
 
                 override: dict[str, str] = {}
-                for field in ("Actual", "Forecast", "Previous"):
-                    value = row.get(field)
+                for column in ("Actual", "Forecast", "Previous"):
+                    value = row.get(column)
                     if value is None:
                         continue
                     text = str(value).strip()
                     if text == "":
                         continue
-                    override[field] = text
+                    override[column] = text
                 if not override:
                     continue
 
@@ -401,11 +664,22 @@ def _load_csv_rows(path: Path) -> list[dict[str, str]]:
 
 
 def _write_csv_rows(path: Path, header: list[str], rows: list[dict[str, str]]) -> None:
-    with path.open("w", encoding="utf-8", newline="") as handle:
+    _write_csv_values(
+        path, header, ([row.get(field, "") for field in header] for row in rows)
+    )
+
+
+def _write_csv_values(
+    path: Path, header: list[str], values: Iterable[Sequence[str]]
+) -> None:
+    # Positional rows in `header` order; accepts a generator so nothing is buffered.
+    # A large file buffer keeps the year-sized CSVs to a handful of write syscalls.
+    with path.open(
+        "w", encoding="utf-8", newline="", buffering=_CSV_WRITE_BUFFER_BYTES
+    ) as handle:
         writer = csv.writer(handle)
         writer.writerow(header)
-        for row in rows:
-            writer.writerow([row.get(field, "") for field in header])
+        writer.writerows(values)
 
 
 def _history_row_key(row: dict[str, str]) -> tuple[str, str, str, str]:
@@ -417,6 +691,13 @@ def _history_row_key(row: dict[str, str]) -> tuple[str, str, str, str]:
     )
 
 
+def _overrides_cell(overrides: object) -> str:
+    # Empty overrides always encode to the same constant; skip the encoder for them.
+    if overrides == {}:
+        return "{}"
+    return json.dumps(overrides, ensure_ascii=False)
+
+
 def _issue_row_key(row: dict[str, str]) -> tuple[str, str, str, str, str]:
     return (
         row.get("Issue", ""),
@@ -460,15 +741,18 @@ def _patch_json_key(row: dict) -> tuple[str, str, str, str, str]:
 def _row_history_sort_key(
     row: dict[str, str],
 ) -> tuple[datetime, tuple[int, int, str], str]:
-    date_value = row.get("Date", "")
-    time_value = row.get("Time", "")
-    period_value = row.get("Period", "")
-    event_value = row.get("Event", row.get("EventId", ""))
-    date_key = _parse_history_datetime(date_value, time_value)
+    # Called once per row by the merge (sort/heapq.merge decorate internally), so
+    # keep it to one dict lookup per field; the EventId fallback only runs for
+    # files without an Event column.
+    get = row.get
+    event_value = get("Event")
+    if event_value is None:
+        event_value = get("EventId", "")
+    date_key = _parse_history_datetime(get("Date", ""), get("Time", ""))
     ref_month = date_key.month if date_key != datetime.min else None
     return (
         date_key,
-        _period_sort_value(period_value, reference_month=ref_month),
+        _period_sort_value(get("Period", ""), reference_month=ref_month),
         event_value,
     )
 
@@ -482,47 +766,71 @@ def _merge_rows_by_date_range(
     start_date: datetime.date,
     end_date: datetime.date,
     sort_key=None,
+    presorted: bool = False,
+    in_range_by_date: dict[str, bool] | None = None,
 ) -> list[dict[str, str]]:
-    new_by_key = {
-        key_func(row): row
-        for row in new_rows
-        if _date_in_range(row.get(date_key, ""), start_date, end_date)
-    }
+    # Rows share a small set of date strings, and the index/clean/issue/patch files
+    # of a year repeat the same ones, so callers can pass one memo for the whole run.
+    in_range = _date_range_checker(start_date, end_date, in_range_by_date)
+    new_by_key: dict = {}
+    for row in new_rows:
+        # Check the range first so `key_func` only runs for rows that can be merged.
+        if in_range(row.get(date_key, "")):
+            new_by_key[key_func(row)] = row
+    # Each existing row is kept or replaced based on its own date only, so rows outside
+    # the range survive wherever they sit. Existing files are not guaranteed to be
+    # date-sorted (committed years can carry out-of-order tails); ordering affects
+    # placement below, never membership.
     merged: list[dict[str, str]] = []
     for row in existing_rows:
-        if not _date_in_range(row.get(date_key, ""), start_date, end_date):
+        if not in_range(row.get(date_key, "")):
             merged.append(row)
             continue
-        key = key_func(row)
-        replacement = new_by_key.pop(key, None)
+        replacement = new_by_key.pop(key_func(row), None)
         if replacement is not None:
             merged.append(replacement)
+    if not new_by_key:
+        return merged
     remaining = list(new_by_key.values())
     if sort_key:
-        remaining.sort(key=sort_key)
+        # New rows are merged into the kept rows in `sort_key` order; `heapq.merge`
+        # emits every row of both inputs even when `merged` is not fully sorted.
+        # `presorted` callers already hand `new_rows` over in `sort_key` order.
+        if not presorted:
+            remaining.sort(key=sort_key)
+        return list(heapq.merge(merged, remaining, key=sort_key))
     merged.extend(remaining)
     return merged
 
 
-def _load_by_event_lines(
+def _scan_by_event_lines(
     path: Path,
     *,
     start_date: datetime.date,
     end_date: datetime.date,
-) -> tuple[dict[str, str], set[str], set[int]]:
+) -> tuple[dict[str, int], set[str], set[int]]:
+    """Record the byte offset of each event line without keeping the lines around.
+
+    The writer re-reads individual lines by offset, so peak memory stays at one
+    event payload.
+    """
+
     if not path.exists():
         return {}, set(), set()
-    lines_by_event: dict[str, str] = {}
+    offsets_by_event: dict[str, int] = {}
     in_range_event_ids: set[str] = set()
     in_range_years: set[int] = set()
     try:
-        with path.open("r", encoding="utf-8") as handle:
+        with path.open("rb") as handle:
+            offset = 0
             for line in handle:
+                line_offset = offset
+                offset += len(line)
                 text = line.strip()
                 if not text:
                     continue
                 try:
-                    payload = json.loads(text)
+                    payload = _json_loads(text)
                 except json.JSONDecodeError:
                     continue
                 event_id = str(payload.get("eventId", "")).strip()
@@ -540,10 +848,30 @@ def _load_by_event_lines(
                             if parsed:
                                 in_range_years.add(parsed.year)
                             break
-                lines_by_event[event_id] = text
+                offsets_by_event[event_id] = line_offset
     except OSError:
         return {}, set(), set()
-    return lines_by_event, in_range_event_ids, in_range_years
+    return offsets_by_event, in_range_event_ids, in_range_years
+
+
+def _read_by_event_line(handle: BinaryIO, offset: int) -> bytes:
+    """Return the record at `offset`, terminated by a single newline."""
+
+    handle.seek(offset)
+    line = handle.readline()
+    # Lines this script wrote come back as-is, ready to be echoed unchanged.
+    if line.endswith(b"\n") and not (line[:1].isspace() or line[-2:-1].isspace()):
+        return line
+    return line.strip() + b"\n"
+
+
+def _by_event_line_points(line: bytes) -> list[list[str]]:
+    try:
+        payload = _json_loads(line)
+    except json.JSONDecodeError:
+        return []
+    points = payload.get("points", [])
+    return points if isinstance(points, list) else []
 
 
 def _point_sort_key(point: list[str]) -> tuple[datetime, tuple[int, int, str], str]:
@@ -565,69 +893,85 @@ def _merge_points_by_date_range(
     *,
     start_date: datetime.date,
     end_date: datetime.date,
+    in_range_by_date: dict[str, bool] | None = None,
 ) -> list[list[str]]:
-    new_in_range = [
-        point
-        for point in new_points
-        if _date_in_range(str(point[0]), start_date, end_date)
-    ]
+    in_range = _date_range_checker(start_date, end_date, in_range_by_date)
+    new_in_range = [point for point in new_points if in_range(str(point[0]))]
     existing_outside = [
-        point
-        for point in existing_points
-        if not _date_in_range(str(point[0]), start_date, end_date)
+        point for point in existing_points if not in_range(str(point[0]))
     ]
+    if not new_in_range and len(existing_outside) == len(existing_points):
+        # Nothing in the range on either side: keep the stored order untouched.
+        return existing_points
     merged = existing_outside + new_in_range
     merged.sort(key=_point_sort_key)
     return merged
 
 
-def _load_by_event_points(path: Path) -> dict[str, list[list[str]]]:
-    if not path.exists():
-        return {}
-    points_by_event: dict[str, list[list[str]]] = {}
+def _read_bytes_or_empty(path: Path) -> bytes:
     try:
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                text = line.strip()
-                if not text:
-                    continue
-                try:
-                    payload = json.loads(text)
-                except json.JSONDecodeError:
-                    continue
-                event_id = str(payload.get("eventId", "")).strip()
-                points = payload.get("points", [])
-                if not event_id or not isinstance(points, list):
-                    continue
-                points_by_event[event_id] = points
+        return path.read_bytes()
     except OSError:
-        return {}
-    return points_by_event
+        return b""
 
 
-def _write_ndjson_index(
-    index_path: Path, index: dict[str, int], *, generated_at: str
+def _write_stamped_json(
+    path: Path,
+    fields: dict[str, object],
+    *,
+    generated_at: str,
+    skip_if_unchanged: bool,
+    trailing_newline: bool = False,
+    existing: bytes | None = None,
+    atomic: bool = False,
 ) -> None:
-    payload = {
-        "generated_at": generated_at,
-        "version": 3,
-        "index": index,
-    }
-    try:
-        if index_path.exists():
-            existing = json.loads(index_path.read_text(encoding="utf-8"))
-            # Avoid rewriting when the index payload is unchanged (keeps `generated_at`
-            # stable and prevents churn on no-op partial updates).
+    """Write `{"generated_at": ..., **fields}` as indented JSON.
+
+    With `skip_if_unchanged`, a file whose content after the `generated_at` line
+    already matches is left alone. The check compares bytes, and the same bytes
+    are reused for the write. Callers that already read the file for merging pass
+    its content as `existing` (`b""` when missing) to avoid a second read. With
+    `atomic`, the bytes go to a sibling `.tmp` file that is then swapped in, so
+    readers never see a truncated file.
+    """
+
+    # `fields` is never empty, so the serialized form starts with "{\n".
+    tail = _json_dumps(fields, indent=True)[2:]
+    if trailing_newline:
+        tail += b"\n"
+    if skip_if_unchanged:
+        if existing is None:
+            existing = _read_bytes_or_empty(path)
+        if existing.endswith(tail):
+            head = existing[: len(existing) - len(tail)]
             if (
-                existing.get("version") == payload["version"]
-                and existing.get("index") == payload["index"]
+                head.startswith(b'{\n  "generated_at": ')
+                and head.endswith(b",\n")
+                and head.count(b"\n") == 2
             ):
                 return
-    except (OSError, json.JSONDecodeError, TypeError):
-        pass
-    index_path.write_text(
-        json.dumps(payload, ensure_ascii=False, indent=2) + "\n",
-        encoding="utf-8",
+    content = b'{\n  "generated_at": ' + _json_dumps(generated_at) + b",\n" + tail
+    if not atomic:
+        path.write_bytes(content)
+        return
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+
+def _write_ndjson_index(
+    index_path: Path, index: dict[str, int], *, generated_at: str
+) -> None:
+    # Avoid rewriting when the index payload is unchanged (keeps `generated_at`
+    # stable and prevents churn on no-op partial updates). The app reads this file
+    # next to the NDJSON, so it is swapped in atomically like the NDJSON itself.
+    _write_stamped_json(
+        index_path,
+        {"version": 3, "index": index},
+        generated_at=generated_at,
+        skip_if_unchanged=True,
+        trailing_newline=True,
+        atomic=True,
     )
 
 
@@ -635,19 +979,96 @@ def _iter_years(
     calendar_dir: Path, start_year: int | None, end_year: int | None
 ) -> list[int]:
     years: list[int] = []
-    for entry in calendar_dir.iterdir():
-        if not entry.is_dir():
-            continue
-        try:
-            year = int(entry.name)
-        except ValueError:
-            continue
-        if start_year is not None and year < start_year:
+    # `DirEntry.is_dir` reuses the type from the directory listing (no stat per entry).
+    with os.scandir(calendar_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                year = int(entry.name)
+            except ValueError:
+                continue
+            if start_year is not None and year < start_year:
+                continue
+            if end_year is not None and year > end_year:
+                continue
+            years.append(year)
+    return sorted(years)
+
+
+def _build_year_entries(
+    year_dir: Path,
+    year: int,
+    manual_overrides: dict[tuple[str, str, str, str], dict[str, str]],
+) -> list[HistoryRow]:
+    # Module-level so it can run in a worker process; each year file is independent.
+    entries: list[HistoryRow] = []
+    # Releases cluster on a few hundred (Date, Time) slots per year, so each distinct
+    # slot is parsed once and shared, like a column-wise `to_datetime(cache=True)`.
+    sort_keys: dict[tuple[str, str], datetime] = {}
+    rows = _load_year_rows(year_dir, year)
+    for row in rows:
+        if not isinstance(row, dict):
             continue
-        if end_year is not None and year > end_year:
+        event = _safe_text(row.get("Event"))
+        if not event:
             continue
-        years.append(year)
-    return sorted(years)
+        # Names, ids, dates and times repeat across thousands of rows and make up
+        # every (event_id, date, time, period) key; interning shares one object per
+        # value so key equality checks short-circuit on identity and memory stays flat.
+        event = sys.intern(event)
+        cur = sys.intern(_safe_text(row.get("Cur.")))
+        event_id, identity = build_event_canonical_id(cur, event)
+        event_id = sys.intern(event_id)
+        period_value = _normalize_period(identity.period)
+        date_value = sys.intern(_safe_text(row.get("Date")))
+        time_value = sys.intern(_safe_text(row.get("Time")))
+        actual_value = _safe_text(row.get("Actual"))
+        forecast_value = _safe_text(row.get("Forecast"))
+        previous_value = _safe_text(row.get("Previous"))
+
+        slot = (date_value, time_value)
+        sort_key = sort_keys.get(slot)
+        if sort_key is None:
+            sort_key = sort_keys[slot] = _parse_history_datetime(date_value, time_value)
+
+        manual_key = (event_id, date_value, time_value, period_value)
+        manual = manual_overrides.get(manual_key)
+        manual_override_actual = False
+        manual_override_forecast = False
+        manual_override_previous = False
+        if manual:
+            if "Actual" in manual:
+                actual_value = manual["Actual"]
+                manual_override_actual = True
+            if "Forecast" in manual:
+                forecast_value = manual["Forecast"]
+                manual_override_forecast = True
+            if "Previous" in manual:
+                previous_value = manual["Previous"]
+                manual_override_previous = True
+        entries.append(
+            HistoryRow(
+                year=year,
+                event_id=event_id,
+                cur=cur,
+                event=event,
+                period=period_value,
+                date=date_value,
+                time=time_value,
+                actual=actual_value,
+                forecast=forecast_value,
+                previous_raw=previous_value,
+                previous_effective=previous_value,
+                manual_override_actual=manual_override_actual,
+                manual_override_forecast=manual_override_forecast,
+                manual_override_previous=manual_override_previous,
+                sort_key=sort_key,
+                actual_missing=_is_missing(actual_value),
+                previous_missing=_is_missing(previous_value),
+            )
+        )
+    return entries
 
 
 def build_index(
@@ -664,6 +1085,13 @@ def build_index(
         raise SystemExit(f"Calendar directory not found: {calendar_dir}")
     output_dir.mkdir(parents=True, exist_ok=True)
     partial_update = start_date is not None and end_date is not None
+    # One clock read per run: every file gets the same stamp, and the stale-actual
+    # cutoff is measured from the same instant.
+    run_started = datetime.now(timezone.utc)
+    generated_at = run_started.strftime("%d-%m-%Y %H:%M")
+    # Shared by every in-window date check (merges and the affected-event sweep); the
+    # range is fixed per run.
+    merge_in_range: dict[str, bool] = {}
 
     manual_patch_path = output_dir / _DEFAULT_MANUAL_PATCH_FILENAME
     manual_overrides, manual_issues = _load_manual_overrides(manual_patch_path)
@@ -672,105 +1100,60 @@ def build_index(
     if not years:
         raise SystemExit("No calendar year folders found.")
 
-    existing_lines: dict[str, str] = {}
+    existing_offsets: dict[str, int] = {}
     existing_in_range_event_ids: set[str] = set()
     existing_in_range_years: set[int] = set()
     if partial_update:
         by_event_path = output_dir / _BY_EVENT_NDJSON_FILENAME
         if by_event_path.exists():
             (
-                existing_lines,
+                existing_offsets,
                 existing_in_range_event_ids,
                 existing_in_range_years,
-            ) = _load_by_event_lines(
+            ) = _scan_by_event_lines(
                 by_event_path,
                 start_date=start_date,
                 end_date=end_date,
             )
 
-    rows_written = 0
+    year_dirs = [calendar_dir / str(year) for year in years]
+    workers = min(len(years), os.cpu_count() or 1)
     entries: list[HistoryRow] = []
-    for year in years:
-        year_dir = calendar_dir / str(year)
-        rows = _load_year_rows(year_dir, year)
-        for row in rows:
-            if not isinstance(row, dict):
-                continue
-            event = _safe_text(row.get("Event"))
-            if not event:
-                continue
-            cur = _safe_text(row.get("Cur."))
-            event_id, identity = build_event_canonical_id(cur, event)
-            period_value = _normalize_period(identity.period)
-            date_value = _safe_text(row.get("Date"))
-            time_value = _safe_text(row.get("Time"))
-            actual_value = _safe_text(row.get("Actual"))
-            forecast_value = _safe_text(row.get("Forecast"))
-            previous_value = _safe_text(row.get("Previous"))
-
-            manual_key = (event_id, date_value, time_value, period_value)
-            manual = manual_overrides.get(manual_key)
-            manual_override_actual = False
-            manual_override_forecast = False
-            manual_override_previous = False
-            if manual:
-                if "Actual" in manual:
-                    actual_value = manual["Actual"]
-                    manual_override_actual = True
-                if "Forecast" in manual:
-                    forecast_value = manual["Forecast"]
-                    manual_override_forecast = True
-                if "Previous" in manual:
-                    previous_value = manual["Previous"]
-                    manual_override_previous = True
-            entries.append(
-                HistoryRow(
-                    year=year,
-                    event_id=event_id,
-                    cur=cur,
-                    event=event,
-                    period=period_value,
-                    date=date_value,
-                    time=time_value,
-                    actual=actual_value,
-                    forecast=forecast_value,
-                    previous_raw=previous_value,
-                    previous_effective=previous_value,
-                    manual_override_actual=manual_override_actual,
-                    manual_override_forecast=manual_override_forecast,
-                    manual_override_previous=manual_override_previous,
-                    sort_key=_parse_history_datetime(date_value, time_value),
-                )
-            )
-            rows_written += 1
-
-    affected_event_ids = (
-        {
-            entry.event_id
-            for entry in entries
-            if _date_in_range(entry.date, start_date, end_date)
-        }
-        if partial_update
-        else set()
-    )
-    if partial_update and existing_in_range_event_ids:
-        affected_event_ids.update(existing_in_range_event_ids)
-    target_years = (
-        {entry.year for entry in entries if entry.event_id in affected_event_ids}.union(
-            existing_in_range_years
-        )
-        if partial_update
-        else set(years)
-    )
+    if workers > 1:
+        # CSV/JSON decoding and canonical-id parsing are CPU bound, so spread the
+        # years across processes; `map` keeps the results in year order.
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for year_entries in executor.map(
+                _build_year_entries, year_dirs, years, repeat(manual_overrides)
+            ):
+                entries.extend(year_entries)
+    else:
+        for year_dir, year in zip(year_dirs, years):
+            entries.extend(_build_year_entries(year_dir, year, manual_overrides))
+    rows_written = len(entries)
 
     issues: list[dict] = []
     patches: list[dict] = []
     manual_applied: list[dict] = []
     existing_keys: set[tuple[str, str, str, str]] = set()
-    grouped: dict[str, list[HistoryRow]] = {}
+    grouped: defaultdict[str, list[HistoryRow]] = defaultdict(list)
+    # Filled by the grouping sweep below: events with at least one non-missing actual.
+    events_with_actual: set[str] = set()
+    # Partial updates: events with a release inside the window, also filled by the
+    # sweep through the shared date-range memo.
+    affected_event_ids: set[str] = set()
+    in_window = (
+        _date_range_checker(start_date, end_date, merge_in_range)
+        if partial_update
+        else None
+    )
     for entry in entries:
         existing_keys.add((entry.event_id, entry.date, entry.time, entry.period))
-        grouped.setdefault(entry.event_id, []).append(entry)
+        grouped[entry.event_id].append(entry)
+        if not entry.actual_missing:
+            events_with_actual.add(entry.event_id)
+        if in_window is not None and in_window(entry.date):
+            affected_event_ids.add(entry.event_id)
         if (
             entry.manual_override_actual
             or entry.manual_override_forecast
@@ -797,21 +1180,27 @@ def build_index(
                 }
             )
 
-    event_has_actual = {
-        event_id: any(not _is_missing(entry.actual) for entry in group)
-        for event_id, group in grouped.items()
-    }
+    if partial_update and existing_in_range_event_ids:
+        affected_event_ids.update(existing_in_range_event_ids)
+    # `grouped` holds every entry, so only the affected events' rows are visited.
+    target_years = (
+        {
+            entry.year
+            for event_id in affected_event_ids
+            for entry in grouped.get(event_id, ())
+        }.union(existing_in_range_years)
+        if partial_update
+        else set(years)
+    )
 
     for event_id, group in grouped.items():
-        group.sort(key=_history_sort_key)
+        group.sort(key=_cached_history_sort_key)
         last_actual: str | None = None
         for entry in group:
             prior_actual = last_actual
-            if prior_actual and not _is_missing(prior_actual):
-                if (
-                    _is_missing(entry.previous_raw)
-                    and not entry.manual_override_previous
-                ):
+            # `last_actual` only ever holds non-missing values.
+            if prior_actual:
+                if entry.previous_missing and not entry.manual_override_previous:
                     entry.previous_effective = prior_actual
                     patch = {
                         "patch": _AUTO_PREVIOUS_FILL_PATCH,
@@ -845,7 +1234,7 @@ def build_index(
                     # "effective" actual series. Keep the issues list focused on actionable
                     # problems (missing values / patches).
                     pass
-            if not _is_missing(entry.actual):
+            if not entry.actual_missing:
                 last_actual = entry.actual
 
     for manual_key, manual in manual_overrides.items():
@@ -870,14 +1259,15 @@ def build_index(
 
     issues.extend(manual_issues)
 
-    now_utc = datetime.now(timezone.utc).replace(tzinfo=None)
+    now_utc = run_started.replace(tzinfo=None)
     stale_actual_cutoff = now_utc - timedelta(days=_STALE_MISSING_ACTUAL_DAYS)
 
     dropped_stale_missing_actual: set[tuple[str, str, str, str]] = set()
     filtered_grouped: dict[str, list[HistoryRow]] = {}
-    for event_id, group in grouped.items():
-        group_sorted = sorted(group, key=_history_sort_key)
-        if not event_has_actual.get(event_id):
+    for event_id, group_sorted in grouped.items():
+        # Groups were sorted in place by the previous-fill pass, which only touches
+        # `previous_effective`, so their order still holds here.
+        if event_id not in events_with_actual:
             filtered_grouped[event_id] = group_sorted
             continue
 
@@ -885,7 +1275,7 @@ def build_index(
         for entry in reversed(group_sorted):
             if entry.sort_key == datetime.min:
                 continue
-            if not _is_missing(entry.actual):
+            if not entry.actual_missing:
                 newer_actual = entry
                 continue
             if (
@@ -909,7 +1299,7 @@ def build_index(
 
         kept: list[HistoryRow] = []
         for entry in group_sorted:
-            if not _is_missing(entry.actual):
+            if not entry.actual_missing:
                 kept.append(entry)
                 continue
             if entry.sort_key == datetime.min:
@@ -945,21 +1335,9 @@ def build_index(
         # an actual value (skip over releases that are missing actual).
         # - Graph uses `actual_effective` (revised value).
         # - Table surfaces revision info under the newer row's "Previous".
-        for idx, current in enumerate(group):
-            if _is_missing(current.actual):
-                continue
-
-            next_entry: HistoryRow | None = None
-            for lookahead in range(idx + 1, len(group)):
-                candidate_entry = group[lookahead]
-                if _is_missing(candidate_entry.actual):
-                    continue
-                next_entry = candidate_entry
-                break
-
-            if next_entry is None:
-                continue
-
+        # Linear: pair consecutive releases that have an actual, no per-row lookahead.
+        with_actual = [entry for entry in group if not entry.actual_missing]
+        for current, next_entry in zip(with_actual, with_actual[1:]):
             candidate = next_entry.previous_effective
             if not candidate or _is_missing(candidate):
                 continue
@@ -969,12 +1347,15 @@ def build_index(
             current.actual_revised_from = current.actual
             next_entry.previous_revised_from = current.actual
 
-    by_year: dict[int, list[HistoryRow]] = {}
+    by_year: defaultdict[int, list[HistoryRow]] = defaultdict(list)
     for entry in entries:
         key = (entry.event_id, entry.date, entry.time, entry.period)
         if key in dropped_stale_missing_actual:
             continue
-        by_year.setdefault(entry.year, []).append(entry)
+        by_year[entry.year].append(entry)
+    # The index and clean CSVs emit each year in the same order; sort once for both.
+    for year_entries in by_year.values():
+        year_entries.sort(key=_cached_history_sort_key)
 
     if write_index:
         index_header = [
@@ -986,43 +1367,6 @@ def build_index(
             "Forecast",
             "Previous",
         ]
-        for year in years:
-            if partial_update and year not in target_years:
-                continue
-            output_path = output_dir / f"{year}_event_history_index.csv"
-            new_rows = [
-                {
-                    "EventId": entry.event_id,
-                    "Date": entry.date,
-                    "Time": entry.time,
-                    "Period": entry.period,
-                    "Actual": entry.actual,
-                    "Forecast": entry.forecast,
-                    "Previous": entry.previous_effective,
-                }
-                for entry in sorted(by_year.get(year, []), key=_history_sort_key)
-            ]
-            rows_to_write = new_rows
-            if partial_update and output_path.exists():
-                existing_rows = _load_csv_rows(output_path)
-                rows_to_write = _merge_rows_by_date_range(
-                    existing_rows,
-                    new_rows,
-                    date_key="Date",
-                    key_func=_history_row_key,
-                    start_date=start_date,
-                    end_date=end_date,
-                    sort_key=_row_history_sort_key,
-                )
-            _write_csv_rows(output_path, index_header, rows_to_write)
-
-        if not partial_update:
-            legacy_clean_path = output_dir / _CLEAN_CSV_FILENAME
-            try:
-                legacy_clean_path.unlink(missing_ok=True)
-            except OSError:
-                pass
-
         clean_header = [
             "EventId",
             "Cur",
@@ -1038,118 +1382,148 @@ def build_index(
             "Previous",
             "PreviousRevisedFrom",
         ]
-        for year in years:
-            if partial_update and year not in target_years:
-                continue
+
+        def write_index_csv(year: int) -> None:
+            output_path = output_dir / f"{year}_event_history_index.csv"
+            index_values = map(_INDEX_CSV_VALUES, by_year.get(year, []))
+            if partial_update and output_path.exists():
+                existing_rows = _load_csv_rows(output_path)
+                rows_to_write = _merge_rows_by_date_range(
+                    existing_rows,
+                    [dict(zip(index_header, values)) for values in index_values],
+                    date_key="Date",
+                    key_func=_history_row_key,
+                    start_date=start_date,
+                    end_date=end_date,
+                    sort_key=_row_history_sort_key,
+                    in_range_by_date=merge_in_range,
+                )
+                _write_csv_rows(output_path, index_header, rows_to_write)
+            else:
+                _write_csv_values(output_path, index_header, index_values)
+
+        def write_clean_csv(year: int) -> None:
             clean_path = output_dir / f"{year}_{_CLEAN_CSV_FILENAME}"
-            new_rows = [
-                {
-                    "EventId": entry.event_id,
-                    "Cur": entry.cur,
-                    "Event": entry.event,
-                    "Period": entry.period,
-                    "Date": entry.date,
-                    "Time": entry.time,
-                    "ActualRaw": entry.actual,
-                    "ActualEffective": entry.actual_effective,
-                    "ActualRevisedFrom": entry.actual_revised_from,
-                    "Forecast": entry.forecast,
-                    "PreviousRaw": entry.previous_raw,
-                    "Previous": entry.previous_effective,
-                    "PreviousRevisedFrom": entry.previous_revised_from,
-                }
-                for entry in sorted(by_year.get(year, []), key=_history_sort_key)
-            ]
-            rows_to_write = new_rows
+            clean_values = map(_CLEAN_CSV_VALUES, by_year.get(year, []))
             if partial_update and clean_path.exists():
                 existing_rows = _load_csv_rows(clean_path)
                 rows_to_write = _merge_rows_by_date_range(
                     existing_rows,
-                    new_rows,
+                    [dict(zip(clean_header, values)) for values in clean_values],
                     date_key="Date",
                     key_func=_history_row_key,
                     start_date=start_date,
                     end_date=end_date,
                     sort_key=_row_history_sort_key,
+                    # Same (date/time, period, event) order as the entries.
+                    presorted=True,
+                    in_range_by_date=merge_in_range,
                 )
-            _write_csv_rows(clean_path, clean_header, rows_to_write)
+                _write_csv_rows(clean_path, clean_header, rows_to_write)
+            else:
+                _write_csv_values(clean_path, clean_header, clean_values)
+
+        if not partial_update:
+            legacy_clean_path = output_dir / _CLEAN_CSV_FILENAME
+            try:
+                legacy_clean_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+        # Each (year, file) pair only reads the shared, already-sorted `by_year`
+        # buckets and writes its own file, so the writes overlap on a thread pool
+        # (file IO releases the GIL). `result()` re-raises any writer error.
+        write_years = [
+            year for year in years if not partial_update or year in target_years
+        ]
+        with ThreadPoolExecutor() as executor:
+            futures = [
+                executor.submit(writer, year)
+                for year in write_years
+                for writer in (write_index_csv, write_clean_csv)
+            ]
+            for future in futures:
+                future.result()
 
         by_event_path = output_dir / _BY_EVENT_NDJSON_FILENAME
-        existing_by_event = (
-            _load_by_event_points(by_event_path)
-            if partial_update and by_event_path.exists()
-            else {}
-        )
         by_event_index: dict[str, int] = {}
-        if partial_update and existing_lines:
-            event_ids = sorted(set(grouped.keys()) | set(existing_lines.keys()))
+        if partial_update and existing_offsets:
+            # Dict key views support `|` directly; no intermediate sets needed.
+            event_ids = sorted(grouped.keys() | existing_offsets.keys())
         else:
-            event_ids = sorted(grouped.keys())
-        with by_event_path.open("wb") as handle:
+            event_ids = sorted(grouped)
+        # Stream into a sibling file and swap it in afterwards: unchanged events are
+        # copied line by line from the current file, which must stay readable until
+        # the new one is complete.
+        tmp_by_event_path = by_event_path.with_name(f"{by_event_path.name}.tmp")
+        with ExitStack() as stack:
+            handle = stack.enter_context(tmp_by_event_path.open("wb"))
+            existing_handle = (
+                stack.enter_context(by_event_path.open("rb"))
+                if existing_offsets
+                else None
+            )
+            # Lines are batched in memory and flushed in large chunks; offsets come
+            # from the running byte count of the lines already emitted.
+            pending = bytearray()
+            offset = 0
             for event_id in event_ids:
                 group = filtered_grouped.get(event_id, [])
-                has_new_range = (
-                    event_id in affected_event_ids if partial_update else True
-                )
-                if partial_update and not has_new_range:
-                    existing_line = existing_lines.get(event_id)
-                    if existing_line is not None:
-                        by_event_index[event_id] = int(handle.tell())
-                        handle.write((existing_line + "\n").encode("utf-8"))
-                        continue
-                    if not group:
-                        continue
+                # Offsets are only collected for partial updates.
+                existing_offset = existing_offsets.get(event_id)
+                if (
+                    partial_update
+                    and existing_offset is not None
+                    and event_id not in affected_event_ids
+                ):
+                    line = _read_by_event_line(existing_handle, existing_offset)
                 elif not group:
                     continue
-
-                points: list[list[str]] = []
-                for entry in group:
-                    row = [
-                        entry.date,
-                        entry.time,
-                        entry.actual_effective,
-                        entry.forecast,
-                        entry.previous_effective,
-                        entry.actual,
-                        entry.previous_raw,
-                        entry.period,
-                    ]
-                    if entry.previous_revised_from:
-                        # Insert before `period` so period stays at the end.
-                        row.insert(-1, entry.previous_revised_from)
-                    points.append(row)
-                if partial_update and existing_by_event:
-                    existing_points = existing_by_event.get(event_id, [])
-                    if existing_points:
-                        has_new_range = any(
-                            _date_in_range(str(point[0]), start_date, end_date)
-                            for point in points
-                        )
-                        has_existing_range = any(
-                            _date_in_range(str(point[0]), start_date, end_date)
-                            for point in existing_points
+                else:
+                    points: list[list[str]] = []
+                    for entry in group:
+                        row = [
+                            entry.date,
+                            entry.time,
+                            entry.actual_effective,
+                            entry.forecast,
+                            entry.previous_effective,
+                            entry.actual,
+                            entry.previous_raw,
+                            entry.period,
+                        ]
+                        if entry.previous_revised_from:
+                            # Insert before `period` so period stays at the end.
+                            row.insert(-1, entry.previous_revised_from)
+                        points.append(row)
+                    if existing_offset is not None:
+                        existing_points = _by_event_line_points(
+                            _read_by_event_line(existing_handle, existing_offset)
                         )
-                        if not (has_new_range or has_existing_range):
-                            points = existing_points
-                        else:
+                        if existing_points:
                             points = _merge_points_by_date_range(
                                 existing_points,
                                 points,
                                 start_date=start_date,
                                 end_date=end_date,
+                                in_range_by_date=merge_in_range,
                             )
-                payload = {
-                    "eventId": event_id,
-                    "points": points,
-                }
-                by_event_index[event_id] = int(handle.tell())
-                handle.write(
-                    (json.dumps(payload, ensure_ascii=False) + "\n").encode("utf-8")
-                )
+                    line = _json_dumps(
+                        {"eventId": event_id, "points": points}, newline=True
+                    )
+                by_event_index[event_id] = offset
+                pending += line
+                # `line` already ends in b"\n", so its length is the full record size.
+                offset += len(line)
+                if len(pending) >= _BY_EVENT_FLUSH_BYTES:
+                    handle.write(pending)
+                    pending.clear()
+            handle.write(pending)
+        os.replace(tmp_by_event_path, by_event_path)
         _write_ndjson_index(
             output_dir / _BY_EVENT_INDEX_FILENAME,
             by_event_index,
-            generated_at=datetime.now(timezone.utc).strftime("%d-%m-%Y %H:%M"),
+            generated_at=generated_at,
         )
 
         if not partial_update:
@@ -1171,53 +1545,47 @@ def build_index(
             "Overrides",
             "Reason",
         ]
-        manual_by_year: dict[int, list[dict]] = {}
-        manual_misc: list[dict] = []
-        for patch in manual_applied:
-            year = _year_from_date_text(str(patch.get("date", "")))
-            if year is None:
-                manual_misc.append(patch)
-                continue
-            manual_by_year.setdefault(year, []).append(patch)
 
-        generated_at = datetime.now(timezone.utc).strftime("%d-%m-%Y %H:%M")
+        def manual_csv_values(records: list[dict]) -> Iterator[tuple[str, ...]]:
+            return (
+                (
+                    patch.get("patch", ""),
+                    patch.get("event_id", ""),
+                    patch.get("period", ""),
+                    patch.get("date", ""),
+                    patch.get("time", ""),
+                    _overrides_cell(patch.get("overrides", {})),
+                    patch.get("reason", ""),
+                )
+                for patch in records
+            )
+
+        manual_by_year, manual_misc = _group_by_date_year(manual_applied)
+
         for year, patches_for_year in sorted(manual_by_year.items()):
             if partial_update and year not in target_years:
                 continue
             manual_csv_path = output_dir / f"{year}_{_MANUAL_APPLIED_CSV_FILENAME}"
-            new_rows = [
-                {
-                    "Patch": patch.get("patch", ""),
-                    "EventId": patch.get("event_id", ""),
-                    "Period": patch.get("period", ""),
-                    "Date": patch.get("date", ""),
-                    "Time": patch.get("time", ""),
-                    "Overrides": json.dumps(
-                        patch.get("overrides", {}), ensure_ascii=False
-                    ),
-                    "Reason": patch.get("reason", ""),
-                }
-                for patch in patches_for_year
-            ]
-            rows_to_write = new_rows
+            csv_values = manual_csv_values(patches_for_year)
             if partial_update and manual_csv_path.exists():
                 existing_rows = _load_csv_rows(manual_csv_path)
                 rows_to_write = _merge_rows_by_date_range(
                     existing_rows,
-                    new_rows,
+                    [dict(zip(manual_header, values)) for values in csv_values],
                     date_key="Date",
                     key_func=_patch_row_key,
                     start_date=start_date,
                     end_date=end_date,
+                    in_range_by_date=merge_in_range,
                 )
-            _write_csv_rows(manual_csv_path, manual_header, rows_to_write)
+                _write_csv_rows(manual_csv_path, manual_header, rows_to_write)
+            else:
+                _write_csv_values(manual_csv_path, manual_header, csv_values)
             manual_json_path = output_dir / f"{year}_{_MANUAL_APPLIED_JSON_FILENAME}"
             patches_payload = patches_for_year
             if partial_update and manual_json_path.exists():
                 try:
-                    existing_payload = json.loads(
-                        manual_json_path.read_text(encoding="utf-8")
-                    )
+                    existing_payload = _json_loads(manual_json_path.read_bytes())
                     existing_patches = existing_payload.get("patches", [])
                 except (OSError, json.JSONDecodeError):
                     existing_patches = []
@@ -1228,51 +1596,36 @@ def build_index(
                     key_func=_patch_json_key,
                     start_date=start_date,
                     end_date=end_date,
+                    in_range_by_date=merge_in_range,
                 )
-            manual_json_path.write_text(
-                json.dumps(
+            manual_json_path.write_bytes(
+                _json_dumps(
                     {
                         "generated_at": generated_at,
                         "patches": patches_payload,
                     },
-                    ensure_ascii=False,
-                    indent=2,
+                    indent=True,
                 )
-                + "\n",
-                encoding="utf-8",
+                + b"\n"
             )
 
         if manual_misc and not partial_update:
             manual_csv_path = output_dir / "event_history_manual_patch_applied_misc.csv"
-            with manual_csv_path.open("w", encoding="utf-8", newline="") as handle:
-                writer = csv.writer(handle)
-                writer.writerow(manual_header)
-                for patch in manual_misc:
-                    writer.writerow(
-                        [
-                            patch.get("patch", ""),
-                            patch.get("event_id", ""),
-                            patch.get("period", ""),
-                            patch.get("date", ""),
-                            patch.get("time", ""),
-                            json.dumps(patch.get("overrides", {}), ensure_ascii=False),
-                            patch.get("reason", ""),
-                        ]
-                    )
+            _write_csv_values(
+                manual_csv_path, manual_header, manual_csv_values(manual_misc)
+            )
             manual_json_path = (
                 output_dir / "event_history_manual_patch_applied_misc.json"
             )
-            manual_json_path.write_text(
-                json.dumps(
+            manual_json_path.write_bytes(
+                _json_dumps(
                     {
                         "generated_at": generated_at,
                         "patches": manual_misc,
                     },
-                    ensure_ascii=False,
-                    indent=2,
+                    indent=True,
                 )
-                + "\n",
-                encoding="utf-8",
+                + b"\n"
             )
 
     try:
@@ -1283,8 +1636,6 @@ def build_index(
     except OSError:
         pass
 
-    generated_at = datetime.now(timezone.utc).strftime("%d-%m-%Y %H:%M")
-
     issue_header = [
         "Issue",
         "EventId",
@@ -1298,53 +1649,47 @@ def build_index(
         "PreviousEffective",
         "Details",
     ]
-    issue_known_keys = {
-        "issue",
-        "event_id",
-        "cur",
-        "event",
-        "period",
-        "date",
-        "time",
-        "previous_raw",
-        "prior_actual",
-        "previous_effective",
-    }
-    issues_by_year: dict[int, list[dict]] = {}
-    issues_misc: list[dict] = []
-    for issue in issues:
-        year = _year_from_date_text(str(issue.get("date", "")))
-        if year is None:
-            issues_misc.append(issue)
-        else:
-            issues_by_year.setdefault(year, []).append(issue)
-
-    solved_issue_types = {
-        _AUTO_PREVIOUS_FILL_PATCH,
-        "stale_missing_actual_dropped",
-    }
+    # Most issues carry the same few extra keys (typically just `cutoff`), so the
+    # encoded Details cell is cached per distinct (key, value) sequence.
+    details_cells: dict[tuple, str] = {}
+
+    def issue_details_cell(issue: dict) -> str:
+        if issue.keys() <= _ISSUE_KNOWN_KEYS:
+            return ""
+        items = tuple(
+            (key, value) for key, value in issue.items() if key not in _ISSUE_KNOWN_KEYS
+        )
+        try:
+            return details_cells[items]
+        except KeyError:
+            cell = details_cells[items] = json.dumps(dict(items), ensure_ascii=False)
+            return cell
+        except TypeError:
+            # Unhashable detail values (lists/dicts) are simply encoded uncached.
+            return json.dumps(dict(items), ensure_ascii=False)
+
+    issues_by_year, (issues_misc, open_misc, solved_misc) = _group_issues_by_date_year(
+        issues
+    )
 
     def write_issue_files(stem: str, issue_rows: list[dict]) -> None:
         issues_path = output_dir / f"{stem}.json"
         issues_csv_path = output_dir / f"{stem}.csv"
 
+        # Read once: the bytes serve both the merge and the unchanged-file check.
+        existing_bytes = _read_bytes_or_empty(issues_path) if partial_update else b""
+        merge_by_range = bool(existing_bytes) and all(
+            _parse_date_only(str(issue.get("date", ""))) for issue in issue_rows
+        )
         existing_issues: list[dict] | None = None
-        if partial_update and issues_path.exists():
+        if merge_by_range:
             try:
-                existing_payload = json.loads(issues_path.read_text(encoding="utf-8"))
-                existing_issues = existing_payload.get("issues", [])
-            except (OSError, json.JSONDecodeError):
+                existing_issues = _json_loads(existing_bytes).get("issues", [])
+            except json.JSONDecodeError:
                 existing_issues = None
 
-        merge_by_range = (
-            partial_update
-            and issues_path.exists()
-            and all(
-                _parse_date_only(str(issue.get("date", ""))) for issue in issue_rows
-            )
-        )
         issues_payload = issue_rows
-        if merge_by_range and existing_issues is not None:
+        if existing_issues is not None:
             issues_payload = _merge_rows_by_date_range(
                 existing_issues,
                 issue_rows,
@@ -1352,113 +1697,84 @@ def build_index(
                 key_func=_issue_json_key,
                 start_date=start_date,
                 end_date=end_date,
+                in_range_by_date=merge_in_range,
             )
 
         # During partial updates, avoid rewriting issue files when the payload is unchanged.
         # This keeps out-of-range years stable (and avoids churn from `generated_at` only).
-        if not (
-            partial_update
-            and existing_issues is not None
-            and existing_issues == issues_payload
-        ):
-            issues_path.write_text(
-                json.dumps(
-                    {
-                        "generated_at": generated_at,
-                        "issues": issues_payload,
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                encoding="utf-8",
-            )
+        _write_stamped_json(
+            issues_path,
+            {"issues": issues_payload},
+            generated_at=generated_at,
+            skip_if_unchanged=partial_update,
+            existing=existing_bytes,
+        )
 
-        csv_rows = []
-        for issue in issue_rows:
-            details = {
-                key: value
-                for key, value in issue.items()
-                if key not in issue_known_keys
-            }
-            csv_rows.append(
-                {
-                    "Issue": issue.get("issue", ""),
-                    "EventId": issue.get("event_id", ""),
-                    "Cur": issue.get("cur", ""),
-                    "Event": issue.get("event", ""),
-                    "Period": issue.get("period", ""),
-                    "Date": issue.get("date", ""),
-                    "Time": issue.get("time", ""),
-                    "PreviousRaw": issue.get("previous_raw", ""),
-                    "PriorActual": issue.get("prior_actual", ""),
-                    "PreviousEffective": issue.get("previous_effective", ""),
-                    "Details": (
-                        json.dumps(details, ensure_ascii=False) if details else ""
-                    ),
-                }
+        csv_values = (
+            (
+                issue.get("issue", ""),
+                issue.get("event_id", ""),
+                issue.get("cur", ""),
+                issue.get("event", ""),
+                issue.get("period", ""),
+                issue.get("date", ""),
+                issue.get("time", ""),
+                issue.get("previous_raw", ""),
+                issue.get("prior_actual", ""),
+                issue.get("previous_effective", ""),
+                issue_details_cell(issue),
             )
-
-        rows_to_write = csv_rows
+            for issue in issue_rows
+        )
         if merge_by_range and issues_csv_path.exists():
             existing_rows = _load_csv_rows(issues_csv_path)
             rows_to_write = _merge_rows_by_date_range(
                 existing_rows,
-                csv_rows,
+                [dict(zip(issue_header, values)) for values in csv_values],
                 date_key="Date",
                 key_func=_issue_row_key,
                 start_date=start_date,
                 end_date=end_date,
+                in_range_by_date=merge_in_range,
             )
-        _write_csv_rows(issues_csv_path, issue_header, rows_to_write)
+            _write_csv_rows(issues_csv_path, issue_header, rows_to_write)
+        else:
+            _write_csv_values(issues_csv_path, issue_header, csv_values)
 
-    for year, issues_for_year in sorted(issues_by_year.items()):
+    issue_jobs: list[tuple[str, list[dict]]] = []
+    for year, (issues_for_year, open_issues, solved_issues) in sorted(
+        issues_by_year.items()
+    ):
         if partial_update and year not in target_years:
             continue
-        write_issue_files(f"{year}_event_history_issues", issues_for_year)
-        open_issues = [
-            issue
-            for issue in issues_for_year
-            if str(issue.get("issue", "")) not in solved_issue_types
-        ]
-        solved_issues = [
-            issue
-            for issue in issues_for_year
-            if str(issue.get("issue", "")) in solved_issue_types
-        ]
-        write_issue_files(f"{year}_event_history_issues_open", open_issues)
-        write_issue_files(f"{year}_event_history_issues_solved", solved_issues)
+        issue_jobs.append((f"{year}_event_history_issues", issues_for_year))
+        issue_jobs.append((f"{year}_event_history_issues_open", open_issues))
+        issue_jobs.append((f"{year}_event_history_issues_solved", solved_issues))
 
     if issues_misc and not partial_update:
-        write_issue_files("event_history_issues_misc", issues_misc)
-        open_misc = [
-            issue
-            for issue in issues_misc
-            if str(issue.get("issue", "")) not in solved_issue_types
-        ]
-        solved_misc = [
-            issue
-            for issue in issues_misc
-            if str(issue.get("issue", "")) in solved_issue_types
+        issue_jobs.append(("event_history_issues_misc", issues_misc))
+        issue_jobs.append(("event_history_issues_misc_open", open_misc))
+        issue_jobs.append(("event_history_issues_misc_solved", solved_misc))
+
+    # Like the index/clean CSVs: every stem owns its own JSON/CSV pair and only
+    # reads shared state (the `details_cells`/date-range memos tolerate racing
+    # inserts of identical values), so the writes overlap on a thread pool.
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(write_issue_files, stem, issue_rows)
+            for stem, issue_rows in issue_jobs
         ]
-        write_issue_files("event_history_issues_misc_open", open_misc)
-        write_issue_files("event_history_issues_misc_solved", solved_misc)
+        for future in futures:
+            future.result()
 
     if not partial_update:
         issue_summary_by_year: dict[str, dict] = {}
         totals_all = 0
         totals_open = 0
         totals_solved = 0
-        for year, issues_for_year in sorted(issues_by_year.items()):
-            open_issues = [
-                issue
-                for issue in issues_for_year
-                if str(issue.get("issue", "")) not in solved_issue_types
-            ]
-            solved_issues = [
-                issue
-                for issue in issues_for_year
-                if str(issue.get("issue", "")) in solved_issue_types
-            ]
+        for year, (issues_for_year, open_issues, solved_issues) in sorted(
+            issues_by_year.items()
+        ):
             totals_all += len(issues_for_year)
             totals_open += len(open_issues)
             totals_solved += len(solved_issues)
@@ -1494,8 +1810,8 @@ def build_index(
             pass
         output_dir_label_str = output_dir_label.as_posix()
 
-        (output_dir / "event_history_issues_summary.json").write_text(
-            json.dumps(
+        (output_dir / "event_history_issues_summary.json").write_bytes(
+            _json_dumps(
                 {
                     "generated_at": generated_at,
                     "output_dir": output_dir_label_str,
@@ -1537,11 +1853,9 @@ def build_index(
                         else None
                     ),
                 },
-                ensure_ascii=False,
-                indent=2,
+                indent=True,
             )
-            + "\n",
-            encoding="utf-8",
+            + b"\n"
         )
 
     patch_header = [
@@ -1556,40 +1870,20 @@ def build_index(
         "PriorActual",
         "PreviousEffective",
     ]
-    patches_by_year: dict[int, list[dict]] = {}
-    patches_misc: list[dict] = []
-    for patch in patches:
-        year = _year_from_date_text(str(patch.get("date", "")))
-        if year is None:
-            patches_misc.append(patch)
-        else:
-            patches_by_year.setdefault(year, []).append(patch)
-
-    for year, patches_for_year in sorted(patches_by_year.items()):
-        if partial_update and year not in target_years:
-            continue
-        patches_path = output_dir / f"{year}_event_history_previous_patch.json"
-        existing_patches: list[dict] | None = None
-        if partial_update and patches_path.exists():
-            try:
-                existing_payload = json.loads(patches_path.read_text(encoding="utf-8"))
-                existing_patches = existing_payload.get("patches", [])
-            except (OSError, json.JSONDecodeError):
-                existing_patches = None
 
+    def write_patch_files(stem: str, patches_for_year: list[dict]) -> None:
+        patches_path = output_dir / f"{stem}.json"
+        existing_bytes = _read_bytes_or_empty(patches_path) if partial_update else b""
         patches_payload = patches_for_year
-        if (
-            partial_update
-            and patches_path.exists()
-            and all(
-                _parse_date_only(str(patch.get("date", "")))
-                for patch in patches_for_year
-            )
+        if existing_bytes and all(
+            _parse_date_only(str(patch.get("date", ""))) for patch in patches_for_year
         ):
-            if existing_patches is None:
-                existing_for_merge: list[dict] = []
-            else:
-                existing_for_merge = existing_patches
+            try:
+                existing_for_merge: list[dict] = _json_loads(existing_bytes).get(
+                    "patches", []
+                )
+            except json.JSONDecodeError:
+                existing_for_merge = []
             patches_payload = _merge_rows_by_date_range(
                 existing_for_merge,
                 patches_for_year,
@@ -1597,42 +1891,19 @@ def build_index(
                 key_func=_patch_json_key,
                 start_date=start_date,
                 end_date=end_date,
+                in_range_by_date=merge_in_range,
             )
 
         # During partial updates, avoid rewriting patch files when the payload is unchanged.
-        if not (
-            partial_update
-            and existing_patches is not None
-            and existing_patches == patches_payload
-        ):
-            patches_path.write_text(
-                json.dumps(
-                    {
-                        "generated_at": generated_at,
-                        "patches": patches_payload,
-                    },
-                    ensure_ascii=False,
-                    indent=2,
-                ),
-                encoding="utf-8",
-            )
-        patches_csv_path = output_dir / f"{year}_event_history_previous_patch.csv"
-        csv_rows = [
-            {
-                "Patch": patch.get("patch", ""),
-                "EventId": patch.get("event_id", ""),
-                "Cur": patch.get("cur", ""),
-                "Event": patch.get("event", ""),
-                "Period": patch.get("period", ""),
-                "Date": patch.get("date", ""),
-                "Time": patch.get("time", ""),
-                "PreviousRaw": patch.get("previous_raw", ""),
-                "PriorActual": patch.get("prior_actual", ""),
-                "PreviousEffective": patch.get("previous_effective", ""),
-            }
-            for patch in patches_for_year
-        ]
-        rows_to_write = csv_rows
+        _write_stamped_json(
+            patches_path,
+            {"patches": patches_payload},
+            generated_at=generated_at,
+            skip_if_unchanged=partial_update,
+            existing=existing_bytes,
+        )
+        patches_csv_path = output_dir / f"{stem}.csv"
+        csv_values = map(_PATCH_CSV_VALUES, patches_for_year)
         if (
             partial_update
             and patches_csv_path.exists()
@@ -1644,46 +1915,35 @@ def build_index(
             existing_rows = _load_csv_rows(patches_csv_path)
             rows_to_write = _merge_rows_by_date_range(
                 existing_rows,
-                csv_rows,
+                [dict(zip(patch_header, values)) for values in csv_values],
                 date_key="Date",
                 key_func=_patch_row_key,
                 start_date=start_date,
                 end_date=end_date,
+                in_range_by_date=merge_in_range,
             )
-        _write_csv_rows(patches_csv_path, patch_header, rows_to_write)
+            _write_csv_rows(patches_csv_path, patch_header, rows_to_write)
+        else:
+            _write_csv_values(patches_csv_path, patch_header, csv_values)
 
+    patches_by_year, patches_misc = _group_by_date_year(patches)
+    patch_jobs = [
+        (f"{year}_event_history_previous_patch", patches_for_year)
+        for year, patches_for_year in sorted(patches_by_year.items())
+        if not partial_update or year in target_years
+    ]
+    # Misc patches are only written by full builds, where the helper neither merges
+    # nor skips, so they share it with the per-year files.
     if patches_misc and not partial_update:
-        patches_path = output_dir / "event_history_previous_patch_misc.json"
-        patches_path.write_text(
-            json.dumps(
-                {
-                    "generated_at": generated_at,
-                    "patches": patches_misc,
-                },
-                ensure_ascii=False,
-                indent=2,
-            ),
-            encoding="utf-8",
-        )
-        patches_csv_path = output_dir / "event_history_previous_patch_misc.csv"
-        with patches_csv_path.open("w", encoding="utf-8", newline="") as handle:
-            writer = csv.writer(handle)
-            writer.writerow(patch_header)
-            for patch in patches_misc:
-                writer.writerow(
-                    [
-                        patch.get("patch", ""),
-                        patch.get("event_id", ""),
-                        patch.get("cur", ""),
-                        patch.get("event", ""),
-                        patch.get("period", ""),
-                        patch.get("date", ""),
-                        patch.get("time", ""),
-                        patch.get("previous_raw", ""),
-                        patch.get("prior_actual", ""),
-                        patch.get("previous_effective", ""),
-                    ]
-                )
+        patch_jobs.append(("event_history_previous_patch_misc", patches_misc))
+
+    with ThreadPoolExecutor() as executor:
+        futures = [
+            executor.submit(write_patch_files, stem, patch_rows)
+            for stem, patch_rows in patch_jobs
+        ]
+        for future in futures:
+            future.result()
 
     return rows_written, len(issues), len(patches)
 